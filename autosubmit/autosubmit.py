@@ -1322,6 +1322,7 @@ class Autosubmit:
             parameters = {}
         parameter_comments: dict = dict(_recurse_into_parameters(parameters))
 
+        yaml = YAML(typ='rt')
         for as_conf_file in template_files:
             origin = str(read_files('autosubmit.config') / f'files/{as_conf_file}')
             target = None
@@ -1354,7 +1355,6 @@ class Autosubmit:
             # much that logic, except we add comments before writing the copy...
             if origin and target:
                 with open(origin, 'r') as input, open(target, 'w+') as output:
-                    yaml = YAML(typ='rt')
                     yaml_data = yaml.load(input)
                     _add_comments_to_yaml(yaml_data, parameter_comments)
                     yaml.dump(yaml_data, output)
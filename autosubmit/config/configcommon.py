@@ -28,6 +28,7 @@ import traceback
 from collections import defaultdict
 from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union, Iterable
 
@@ -41,6 +42,22 @@ from autosubmit.database.db_common import get_experiment_description
 from autosubmit.config.yamlparser import YAMLParserFactory
 from autosubmit.log.log import Log, AutosubmitCritical, AutosubmitError
 
+_WALLCLOCK_WITH_SECONDS_REGEX = re.compile(r'^\d{1,2}:\d{2}:\d{2}$')
+"""Matches wallclocks in the unsupported ``HH:MM:SS`` format."""
+
+
+@lru_cache(maxsize=256)
+def _wallclock_to_seconds(wallclock: str) -> float:
+    """Convert a ``HH:MM`` wallclock to seconds.
+
+    Jobs and platforms reuse a handful of wallclock values, so results are cached.
+
+    :param wallclock: The wallclock in ``HH:MM`` format.
+    :return: The wallclock in seconds.
+    """
+    hours, minutes = map(int, wallclock.split(":"))
+    return timedelta(hours=hours, minutes=minutes).total_seconds()
+
 
 class AutosubmitConfig(object):
     """Class to handle experiment configuration coming from a file or database.
@@ -583,7 +600,7 @@ class AutosubmitConfig(object):
         """
         for job in data_fixed.get("JOBS", {}):
             wallclock = data_fixed["JOBS"][job].get("WALLCLOCK", "")
-            if wallclock and re.match(r'^\d{1,2}:\d{2}:\d{2}$', wallclock):
+            if wallclock and _WALLCLOCK_WITH_SECONDS_REGEX.match(wallclock):
                 # Truncate SS to "HH:MM"
                 Log.warning(
                     f"Wallclock {wallclock} is in HH:MM:SS format. Autosubmit does not support the seconds. Truncating to HH:MM")
@@ -692,17 +709,15 @@ class AutosubmitConfig(object):
         :param ignore_minimal: ignore minimal files
         :return: list of filenames
         """
-        filenames_to_load = []
-        if ignore_minimal:
-            for yaml_file in sorted([p.resolve() for p in Path(yaml_folder).glob("*") if
-                                     p.suffix in {".yml", ".yaml"} and not p.name.endswith(
-                                         ("minimal.yml", "minimal.yaml"))]):
-                filenames_to_load.append(str(yaml_file))
-        else:
-            for yaml_file in sorted(
-                    [p.resolve() for p in Path(yaml_folder).glob("*") if p.suffix in {".yml", ".yaml"}]):
-                filenames_to_load.append(str(yaml_file))
-        return filenames_to_load
+        yaml_files = []
+        with suppress(FileNotFoundError, NotADirectoryError, PermissionError), os.scandir(yaml_folder) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1] not in {".yml", ".yaml"}:
+                    continue
+                if ignore_minimal and entry.name.endswith(("minimal.yml", "minimal.yaml")):
+                    continue
+                yaml_files.append(Path(entry.path).resolve())
+        return [str(yaml_file) for yaml_file in sorted(yaml_files)]
 
     def load_config_folder(self, current_data, yaml_folder, ignore_minimal=False):
         """Load a config folder and return pre and post config
@@ -1229,25 +1244,20 @@ class AutosubmitConfig(object):
         :return: Error message if any job exceeds the platform's wallclock time, otherwise an empty string.
         :rtype: str
         """
-
-        def _calculate_wallclock(wallclock: str) -> float:
-            hours, minutes = map(int, wallclock.split(":"))
-            return timedelta(hours=hours, minutes=minutes).total_seconds()
-
         config_job_wallclock = self.experiment_data.get("CONFIG", {}).get("JOB_WALLCLOCK", "24:00")
-        default_wallclock = _calculate_wallclock(config_job_wallclock)
+        default_wallclock = _wallclock_to_seconds(config_job_wallclock)
         err_msg = ""
         jobs = self.experiment_data.get("JOBS", {})
         platforms = self.experiment_data.get("PLATFORMS", {})
         wallclock_per_platform = {}
 
         for platform_name in platforms.keys():
-            wallclock_per_platform[platform_name] = _calculate_wallclock(platforms[platform_name].get("MAX_WALLCLOCK",
-                                                                                                      config_job_wallclock))
+            wallclock_per_platform[platform_name] = _wallclock_to_seconds(
+                platforms[platform_name].get("MAX_WALLCLOCK", config_job_wallclock))
 
         for job_name, job_data in jobs.items():
             platform_wallclock = wallclock_per_platform.get(job_data.get("PLATFORM", ""), default_wallclock)
-            total_seconds = _calculate_wallclock(job_data.get("WALLCLOCK", "00:01"))
+            total_seconds = _wallclock_to_seconds(job_data.get("WALLCLOCK", "00:01"))
             if total_seconds > platform_wallclock:
                 err_msg += (f"Job {job_name} has a wallclock value of {total_seconds}s, which is greater than "
                             f"the platform's {platform_wallclock}s wallclock time\n")
@@ -2857,10 +2867,10 @@ class AutosubmitConfig(object):
         else:
             # This block may rise an exception but all its callers handle it
             try:
-                with open(file_path) as f:
-                    parser.data = parser.load(f)
-                    if parser.data is None:
-                        parser.data = {}
+                # Given a path, the parser reads the file as bytes and detects its encoding
+                parser.data = parser.load(file_path)
+                if parser.data is None:
+                    parser.data = {}
             except IOError:
                 parser.data = {}
                 return parser
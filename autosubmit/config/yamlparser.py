@@ -16,8 +16,25 @@
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import copy
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
 from ruamel.yaml import YAML
 
+_LOAD_CACHE_MAX_SIZE = 128
+"""Maximum number of parsed YAML files kept in memory by ``YAMLParser.load``.
+The least recently loaded files are evicted first."""
+
+_RACY_INTERVAL_NS = 2_000_000_000
+"""Files changed more recently than this are not cached, as a rewrite within the
+filesystem timestamp granularity could keep the same timestamps and size."""
+
+_load_cache: OrderedDict[tuple[str, int, int, int, int], Any] = OrderedDict()
+
 
 class YAMLParserFactory:
     def __init__(self):
@@ -30,5 +47,34 @@ class YAMLParserFactory:
 class YAMLParser(YAML):
 
     def __init__(self):
-        self.data = []
         super(YAMLParser, self).__init__(typ="rt")
+
+    def load(self, stream: Any) -> Any:
+        """Load a YAML document, reusing the parsed content of unchanged files.
+
+        Files are identified by their absolute path, inode, modification and
+        change times, and size, so a file changed or replaced on disk is parsed
+        again. Callers modify the loaded data in place, so a deep copy of the
+        cached content is returned.
+
+        :param stream: A ``Path`` or the YAML content itself.
+        :return: The parsed YAML content.
+        """
+        if not isinstance(stream, Path):
+            return super(YAMLParser, self).load(stream)
+        file_path = os.path.abspath(stream)
+
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+        if key in _load_cache:
+            _load_cache.move_to_end(key)
+            return copy.deepcopy(_load_cache[key])
+
+        # Parsing from memory avoids the many small reads ruamel does on a file
+        with open(file_path, 'rb') as fp:
+            data = super(YAMLParser, self).load(fp.read())
+        if time.time_ns() - stat.st_ctime_ns > _RACY_INTERVAL_NS:
+            if len(_load_cache) >= _LOAD_CACHE_MAX_SIZE:
+                _load_cache.popitem(last=False)
+            _load_cache[key] = copy.deepcopy(data)
+        return data
@@ -24,6 +24,7 @@ import sys
 import tracemalloc
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from pstats import SortKey
 
@@ -384,6 +385,20 @@ def _generate_title(title="") -> str:
     return "\n".join([separator, message, separator])
 
 
+@lru_cache(maxsize=1)
+def _get_process(pid: int) -> Process:
+    """Return a psutil handle for the given process, reused across checkpoints.
+
+    Keyed by PID so that a forked child does not inspect its parent.
+
+    :param pid: The process ID.
+    :type pid: int
+    :return: The psutil Process for ``pid``.
+    :rtype: Process
+    """
+    return Process(pid)
+
+
 def _get_current_memory() -> int:
     """
     Return the current memory consumption of the process in Bytes.
@@ -391,7 +406,7 @@ def _get_current_memory() -> int:
     :return: The current memory used by the process in Bytes.
     :rtype: int
     """
-    return Process(os.getpid()).memory_info().rss
+    return _get_process(os.getpid()).memory_info().rss
 
 
 def _get_current_object_count() -> int:
@@ -410,7 +425,7 @@ def _get_current_open_fds() -> int:
     :rtype: int
     """
 
-    proc = Process(os.getpid())
+    proc = _get_process(os.getpid())
     if hasattr(proc, "num_fds"):
         return proc.num_fds()
     if hasattr(proc, "num_handles"):
@@ -478,7 +493,7 @@ def _get_current_open_fds_names() -> list:
     pid = os.getpid()
     fd_dir = f"/proc/{pid}/fd"
 
-    proc = Process(pid)
+    proc = _get_process(pid)
     fd_to_conn = _get_fd_connection_map(proc)
     std_fds = {0: "stdin", 1: "stdout", 2: "stderr"}
 
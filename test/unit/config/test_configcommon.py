@@ -449,6 +449,30 @@ def test_validate_wallclock_errors(autosubmit_config: 'AutosubmitConfigFactory')
     assert res == "Job AQUA_ANALYSIS has a wallclock value of 7200.0s, which is greater than the platform's 3600.0s wallclock time\n"
 
 
+@pytest.mark.parametrize('ignore_minimal,expected', [
+    (False, ['.hidden.yml', 'a.yml', 'b.yaml', 'minimal.yml', 'z-minimal.yaml']),
+    (True, ['.hidden.yml', 'a.yml', 'b.yaml'])
+])
+def test_get_yaml_filenames_to_load(ignore_minimal: bool, expected: list[str], autosubmit_config, tmp_path):
+    for name in ['b.yaml', 'a.yml', '.hidden.yml', 'minimal.yml', 'z-minimal.yaml', 'c.YML', 'd.conf', 'yml']:
+        (tmp_path / name).touch()
+    (tmp_path / 'link.yml').symlink_to(tmp_path / 'a.yml')
+    as_conf = autosubmit_config(expid='a000', experiment_data={})
+
+    filenames = as_conf.get_yaml_filenames_to_load(tmp_path, ignore_minimal=ignore_minimal)
+
+    # Symbolic links are resolved, so ``link.yml`` is loaded as ``a.yml``
+    assert filenames == sorted([str(tmp_path / name) for name in expected + ['a.yml']])
+
+
+@pytest.mark.parametrize('error', [None, PermissionError], ids=['missing', 'unreadable'])
+def test_get_yaml_filenames_to_load_missing_folder(autosubmit_config, tmp_path, mocker, error):
+    as_conf = autosubmit_config(expid='a000', experiment_data={})
+    if error is not None:
+        mocker.patch('autosubmit.config.configcommon.os.scandir', side_effect=error)
+    assert as_conf.get_yaml_filenames_to_load(tmp_path / 'missing') == []
+
+
 def test_load_config_file(autosubmit_config, tmp_path):
     """Test most basic functionality of ``load_config_file``."""
     as_conf = autosubmit_config(expid='a000', experiment_data={})
@@ -0,0 +1,157 @@
+# Copyright 2015-2026 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the YAML parser used to load the experiment configuration."""
+
+import io
+import os
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from ruamel.yaml import YAML
+
+from autosubmit.config import yamlparser
+from autosubmit.config.yamlparser import YAMLParserFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_load_cache(monkeypatch):
+    monkeypatch.setattr(yamlparser, '_load_cache', OrderedDict())
+
+
+@pytest.fixture
+def cache_recent_files(monkeypatch):
+    """Allow caching files written during the test."""
+    monkeypatch.setattr(yamlparser, '_RACY_INTERVAL_NS', 0)
+
+
+def test_load_reuses_unchanged_file(tmp_path, mocker, cache_recent_files):
+    yaml_file = tmp_path / 'jobs.yml'
+    yaml_file.write_text('JOBS:\n  SIM:\n    WALLCLOCK: "01:00"\n')
+    spy = mocker.spy(YAML, 'load')
+
+    first = YAMLParserFactory().create_parser().load(yaml_file)
+    second = YAMLParserFactory().create_parser().load(yaml_file)
+
+    assert first == second == {'JOBS': {'SIM': {'WALLCLOCK': '01:00'}}}
+    assert spy.call_count == 1
+
+
+def test_load_shares_cache_between_relative_and_absolute_paths(tmp_path, monkeypatch, mocker, cache_recent_files):
+    (tmp_path / 'jobs.yml').write_text('A: 1\n')
+    monkeypatch.chdir(tmp_path)
+    spy = mocker.spy(YAML, 'load')
+
+    assert YAMLParserFactory().create_parser().load(Path('jobs.yml')) == {'A': 1}
+    assert YAMLParserFactory().create_parser().load(tmp_path / 'jobs.yml') == {'A': 1}
+    assert spy.call_count == 1
+
+
+def test_load_returns_a_copy(tmp_path, cache_recent_files):
+    yaml_file = tmp_path / 'jobs.yml'
+    yaml_file.write_text('JOBS:\n  SIM:\n    WALLCLOCK: "01:00"\n')
+
+    first = YAMLParserFactory().create_parser().load(yaml_file)
+    first['JOBS']['SIM']['WALLCLOCK'] = '02:00'
+
+    assert YAMLParserFactory().create_parser().load(yaml_file)['JOBS']['SIM']['WALLCLOCK'] == '01:00'
+
+
+def test_load_parses_modified_file(tmp_path, cache_recent_files):
+    yaml_file = tmp_path / 'jobs.yml'
+    yaml_file.write_text('A: 1\n')
+    assert YAMLParserFactory().create_parser().load(yaml_file) == {'A': 1}
+
+    yaml_file.write_text('A: 22\n')
+    assert YAMLParserFactory().create_parser().load(yaml_file) == {'A': 22}
+
+
+def test_load_parses_file_rewritten_with_same_mtime_and_size(tmp_path):
+    yaml_file = tmp_path / 'jobs.yml'
+    yaml_file.write_text('A: 1\n')
+    stat = yaml_file.stat()
+    # The file was last changed well before the racy window, so its content is cached
+    old_stat = SimpleNamespace(
+        st_ino=stat.st_ino,
+        st_mtime_ns=stat.st_mtime_ns,
+        st_ctime_ns=stat.st_ctime_ns - yamlparser._RACY_INTERVAL_NS - 1,
+        st_size=stat.st_size,
+    )
+    with patch.object(yamlparser.os, 'stat', return_value=old_stat):
+        assert YAMLParserFactory().create_parser().load(yaml_file) == {'A': 1}
+    assert yamlparser._load_cache
+
+    # Rewriting it now changes the ctime, even if the mtime is restored
+    yaml_file.write_text('A: 2\n')
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert YAMLParserFactory().create_parser().load(yaml_file) == {'A': 2}
+
+
+def test_load_evicts_least_recently_used_file(tmp_path, monkeypatch, cache_recent_files):
+    monkeypatch.setattr(yamlparser, '_LOAD_CACHE_MAX_SIZE', 2)
+    parser = YAMLParserFactory().create_parser()
+    files = []
+    for name in ('a', 'b', 'c'):
+        yaml_file = tmp_path / f'{name}.yml'
+        yaml_file.write_text(f'{name.upper()}: 1\n')
+        files.append(yaml_file)
+
+    parser.load(files[0])
+    parser.load(files[1])
+    parser.load(files[0])
+    parser.load(files[2])
+
+    assert [key[0] for key in yamlparser._load_cache] == [str(files[0]), str(files[2])]
+
+
+def test_load_does_not_cache_recently_modified_file(tmp_path):
+    yaml_file = tmp_path / 'jobs.yml'
+    yaml_file.write_text('A: 1\n')
+
+    assert YAMLParserFactory().create_parser().load(yaml_file) == {'A': 1}
+    assert not yamlparser._load_cache
+
+
+def test_load_detects_file_encoding(tmp_path):
+    yaml_file = tmp_path / 'jobs.yml'
+    yaml_file.write_bytes('DEFAULT:\n  DESCRIPTION: "Pluviómetro"\n'.encode('utf-16'))
+
+    assert YAMLParserFactory().create_parser().load(yaml_file) == {'DEFAULT': {'DESCRIPTION': 'Pluviómetro'}}
+
+
+def test_load_string_content():
+    assert YAMLParserFactory().create_parser().load('A: 1\n') == {'A': 1}
+    assert not yamlparser._load_cache
+
+
+def test_load_open_file_is_not_cached(tmp_path, cache_recent_files):
+    yaml_file = tmp_path / 'jobs.yml'
+    yaml_file.write_text('A: 1\n')
+
+    with open(yaml_file) as stream:
+        assert YAMLParserFactory().create_parser().load(stream) == {'A': 1}
+    assert not yamlparser._load_cache
+
+
+def test_load_stream_without_file_path(cache_recent_files):
+    stream = io.StringIO('A: 1\n')
+    stream.name = '<stdin>'
+
+    assert YAMLParserFactory().create_parser().load(stream) == {'A': 1}
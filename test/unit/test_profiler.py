@@ -14,13 +14,15 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+import os
 from typing import Optional
 
 import pytest
+from psutil import Process
 
 from autosubmit.autosubmit import Autosubmit
 from autosubmit.log.log import AutosubmitCritical
-from autosubmit.profiler.profiler import Profiler
+from autosubmit.profiler.profiler import Profiler, _get_current_memory, _get_current_open_fds, _get_process
 
 
 @pytest.fixture
@@ -78,6 +80,23 @@ def test_memory_profiling_loop(profiler):
     profiler.stop()
 
 
+def test_process_handle_is_reused_per_pid(mocker):
+    process = mocker.patch("autosubmit.profiler.profiler.Process", wraps=Process)
+    _get_process.cache_clear()
+    try:
+        _get_current_memory()
+        _get_current_open_fds()
+        process.assert_called_once_with(os.getpid())
+
+        # A different process, e.g. a forked child, gets its own handle
+        handle = _get_process(os.getpid())
+        assert _get_process(os.getppid()) is not handle
+        assert process.call_count == 2
+        process.assert_called_with(os.getppid())
+    finally:
+        _get_process.cache_clear()
+
+
 @pytest.mark.parametrize(
     "argv, expected_profile, expected_trace",
     [